@@ -8,14 +8,77 @@ Tests the Python wrapper for OSOAA radiative transfer simulations.
 import subprocess
 import numpy as np
 import os
+import copy
+import hashlib
+import itertools
+import json
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from typing import Dict, Optional, List
 
 import pytest
 
 
+# Background deletion of work directories (waited for at session teardown)
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='osoaa_cleanup')
+_CLEANUP_FUTURES = []
+
+
+# Parameters that determine the content of the MIE_AER files
+_MIE_AER_KEYS = ('OSOAA.Wa', 'AER.Waref', 'AER.Model')
+_MIE_AER_KEY_PREFIXES = ('AER.MMD.',)
+
+# Parameters that determine the content of the MIE_HYD files
+_MIE_HYD_KEYS = ('OSOAA.Wa', 'HYD.Model')
+_MIE_HYD_KEY_PREFIXES = ('PHYTO.JD.', 'SED.JD.')
+
+# Parameters that determine the content of the SURF files (the angle
+# settings enter their names through the Gauss quadrature)
+_SURF_KEYS = ('SEA.Ind', 'SEA.Wind')
+_SURF_KEY_PREFIXES = ('ANG.',)
+
+
+def _files_key(params: Dict, keys, prefixes, exe_mtime: int) -> str:
+    """Hash the executable's mtime and the subset of params selected by keys/prefixes."""
+    items = sorted((key, value) for key, value in params.items()
+                   if key in keys or key.startswith(prefixes))
+    return hashlib.blake2b(repr((exe_mtime, items)).encode(), digest_size=16).hexdigest()
+
+
+@contextmanager
+def _published_dir(directory: str):
+    """
+    Yield the directory a run should use for a set of shared OSOAA files.
+
+    OSOAA computes a file when it does not exist yet and reads it otherwise,
+    with no locking. An existing directory is complete and is used as is.
+    Otherwise the run fills a private sibling, renamed into place if the
+    run succeeds and removed if it fails, so no run sees a partial file.
+    When concurrent runs fill the same directory, the first to finish
+    publishes its files and the others discard theirs.
+    """
+    if os.path.isdir(directory):
+        yield directory
+        return
+
+    parent, name = os.path.split(directory)
+    os.makedirs(parent, exist_ok=True)
+    fill_dir = tempfile.mkdtemp(prefix=f'{name}.tmp-', dir=parent)
+    try:
+        yield fill_dir
+    except BaseException:
+        shutil.rmtree(fill_dir, ignore_errors=True)
+        raise
+
+    try:
+        os.rename(fill_dir, directory)
+    except OSError:  # Published by another run in the meantime
+        shutil.rmtree(fill_dir, ignore_errors=True)
+
+
 # ---------------------------------------------------------------------------
 # OSOAASimulation class (from notebook)
 # ---------------------------------------------------------------------------
@@ -28,8 +91,23 @@ class OSOAASimulation:
     - Parameter configuration with correct OSOAA keywords
     - Execution of the Fortran code via command-line arguments
     - Parsing of output files
+
+    The MIE_AER, MIE_HYD and SURF directories of work_dir live as long as
+    the instance and are shared by all its runs, so OSOAA reuses the Mie
+    and surface files computed by earlier runs; each set of files goes to a
+    keyed subdirectory, published only by a successful run (see
+    _shared_dirs). The results (OSOAA.ResRoot) go to a per-run
+    subdirectory.
     """
 
+    # Directories of files that OSOAA computes once and then reuses, with
+    # the parameters (names, prefixes) that determine their content
+    _SHARED_DIR_KEYS = {
+        'AER.DirMie': (_MIE_AER_KEYS, _MIE_AER_KEY_PREFIXES),
+        'HYD.DirMie': (_MIE_HYD_KEYS, _MIE_HYD_KEY_PREFIXES),
+        'SEA.Dir': (_SURF_KEYS, _SURF_KEY_PREFIXES),
+    }
+
     def __init__(self, osoaa_root: Path, work_dir: Optional[Path] = None):
         self.osoaa_root = Path(osoaa_root).resolve()
         self.exe_path = self.osoaa_root / 'exe' / 'OSOAA_MAIN.exe'
@@ -53,39 +131,26 @@ class OSOAASimulation:
         if not self.exe_path.exists():
             raise FileNotFoundError(f"OSOAA executable not found at {self.exe_path}")
 
-    def get_default_params(self, wavelength_nm: float = 550.0,
-                           solar_zenith: float = 30.0,
-                           chlorophyll: float = 0.1,
-                           aot: float = 0.1,
-                           wind_speed: float = 5.0) -> Dict:
-        """
-        Generate default simulation parameters.
+        # Invariant parts of every OSOAA invocation
+        self._exe_str = str(self.exe_path)
+        self._cwd = str(self.osoaa_root)
+        self._env = {**os.environ, 'OSOAA_ROOT': self._cwd}
 
-        Parameters
-        ----------
-        wavelength_nm : float
-            Simulation wavelength in nm (will be converted to micrometers)
-        solar_zenith : float
-            Solar zenith angle in degrees (0-90)
-        chlorophyll : float
-            Chlorophyll-a concentration in mg/m³
-        aot : float
-            Aerosol optical thickness at reference wavelength
-        wind_speed : float
-            Wind speed in m/s for sea surface roughness
-        """
-        # Convert wavelength from nm to micrometers
-        wavelength_um = wavelength_nm / 1000.0
+        self._work_str = str(self.work_dir)
+        self._mie_aer_str = str(self.mie_aer_dir)
+        self._mie_hyd_str = str(self.mie_hyd_dir)
+        self._surf_str = str(self.surf_dir)
 
-        return {
+        # Default parameters; get_default_params overrides the variable ones
+        self._params_template = {
             # Working directory (required)
-            'OSOAA.ResRoot': str(self.work_dir),
+            'OSOAA.ResRoot': self._work_str,
 
             # Wavelength in micrometers
-            'OSOAA.Wa': wavelength_um,
+            'OSOAA.Wa': 0.55,
 
             # Solar geometry
-            'ANG.Thetas': solar_zenith,
+            'ANG.Thetas': 30.0,
 
             # Viewing geometry
             'OSOAA.View.Phi': 90.0,       # Relative azimuth angle (degrees)
@@ -98,9 +163,9 @@ class OSOAASimulation:
             'AP.HA': 2.0,                  # Aerosol scale height (km)
 
             # Aerosol model - mono-modal log-normal distribution (Model 0, SDtype 1)
-            'AER.DirMie': str(self.mie_aer_dir),
-            'AER.Waref': wavelength_um,    # Reference wavelength (micrometers)
-            'AER.AOTref': aot,             # AOT at reference wavelength
+            'AER.DirMie': self._mie_aer_str,
+            'AER.Waref': 0.55,             # Reference wavelength (micrometers)
+            'AER.AOTref': 0.1,             # AOT at reference wavelength
             'AER.Model': 0,                # Mono-modal model
             'AER.MMD.MRwa': 1.45,          # Real refractive index
             'AER.MMD.MIwa': -0.001,        # Imaginary refractive index (MUST be negative)
@@ -112,9 +177,9 @@ class OSOAASimulation:
             'SEA.Depth': 100.0,            # Ocean depth (m)
 
             # Hydrosol model - Junge phytoplankton (Model 1)
-            'HYD.DirMie': str(self.mie_hyd_dir),
+            'HYD.DirMie': self._mie_hyd_str,
             'HYD.Model': 1,                # 1 = Use phytoplankton Junge model
-            'PHYTO.Chl': chlorophyll,      # Chlorophyll concentration (mg/m³)
+            'PHYTO.Chl': 0.1,              # Chlorophyll concentration (mg/m³)
             'PHYTO.ProfilType': 1,         # 1 = Homogeneous profile
 
             # Phytoplankton optical properties (Junge distribution)
@@ -131,9 +196,9 @@ class OSOAASimulation:
             'DET.Abs440': 0.0,             # Detritus absorption at 440nm
 
             # Sea surface
-            'SEA.Dir': str(self.surf_dir),
+            'SEA.Dir': self._surf_str,
             'SEA.Ind': 1.34,               # Refractive index of seawater
-            'SEA.Wind': wind_speed,        # Wind speed (m/s)
+            'SEA.Wind': 5.0,               # Wind speed (m/s)
             'SEA.SurfAlb': 0.0,            # Surface albedo
             'SEA.BotType': 1,              # Bottom type
             'SEA.BotAlb': 0.30,            # Bottom albedo
@@ -142,21 +207,75 @@ class OSOAASimulation:
             'OSOAA.ResFile.vsVZA': 'LUM_vsVZA.txt',
         }
 
+        # Parsed results of previous runs, keyed by (exe mtime, params hash)
+        self._run_cache: Dict[tuple, Dict] = {}
+
+    def get_default_params(self, wavelength_nm: float = 550.0,
+                           solar_zenith: float = 30.0,
+                           chlorophyll: float = 0.1,
+                           aot: float = 0.1,
+                           wind_speed: float = 5.0) -> Dict:
+        """
+        Generate default simulation parameters.
+
+        Parameters
+        ----------
+        wavelength_nm : float
+            Simulation wavelength in nm (will be converted to micrometers)
+        solar_zenith : float
+            Solar zenith angle in degrees (0-90)
+        chlorophyll : float
+            Chlorophyll-a concentration in mg/m³
+        aot : float
+            Aerosol optical thickness at reference wavelength
+        wind_speed : float
+            Wind speed in m/s for sea surface roughness
+        """
+        params = self._params_template.copy()
+
+        # Convert wavelength from nm to micrometers
+        params['OSOAA.Wa'] = wavelength_nm / 1000.0
+        params['AER.Waref'] = params['OSOAA.Wa']
+        params['ANG.Thetas'] = solar_zenith
+        params['PHYTO.Chl'] = chlorophyll
+        params['AER.AOTref'] = aot
+        params['SEA.Wind'] = wind_speed
+        return params
+
     def build_command(self, params: Dict) -> List[str]:
         """Build command-line arguments for OSOAA."""
-        cmd = [str(self.exe_path)]
-        for key, value in params.items():
-            cmd.extend([f'-{key}', str(value)])
-        return cmd
+        return [self._exe_str, *itertools.chain.from_iterable(
+            (f'-{key}', str(value)) for key, value in params.items()
+        )]
 
-    def run(self, params: Dict, verbose: bool = False, timeout: int = 600) -> Dict:
+    def run(self, params: Dict, verbose: bool = False, timeout: int = 600,
+            run_dir: Optional[Path] = None) -> Dict:
         """
         Run OSOAA simulation with given parameters.
 
+        OSOAA writes its outputs to run_dir, which defaults to a new
+        subdirectory of work_dir so that repeated or concurrent runs of the
+        same instance keep separate Standard_outputs.
+
+        Non-verbose runs are memoized: a run whose parameters (other than
+        'OSOAA.ResRoot') match an earlier one returns a copy of its results,
+        unless the executable has been rebuilt since.
+
         Returns dictionary with parsed results.
         """
-        # Build command
-        cmd = self.build_command(params)
+        cache_key = None
+        if not verbose and run_dir is None:
+            params_hash = hashlib.blake2b(json.dumps(
+                {key: value for key, value in params.items() if key != 'OSOAA.ResRoot'},
+                sort_keys=True, default=str
+            ).encode()).hexdigest()
+            cache_key = (self.exe_path.stat().st_mtime_ns, params_hash)
+            if cache_key in self._run_cache:
+                return copy.deepcopy(self._run_cache[cache_key])
+
+        if run_dir is None:
+            run_dir = tempfile.mkdtemp(prefix='run_', dir=self.work_dir)
+        params = {**params, 'OSOAA.ResRoot': str(run_dir)}
 
         if verbose:
             wl_nm = params.get('OSOAA.Wa', 0) * 1000
@@ -166,33 +285,89 @@ class OSOAASimulation:
             print(f"  Solar zenith: {params.get('ANG.Thetas', 'N/A')}°")
             print(f"  AOT: {params.get('AER.AOTref', 'N/A')}")
 
-        # Run simulation
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=str(self.osoaa_root),
-            env={**os.environ, 'OSOAA_ROOT': str(self.osoaa_root)},
-            timeout=timeout
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"OSOAA simulation failed with return code {result.returncode}\n"
-                f"STDOUT: {result.stdout[:1000] if result.stdout else '(empty)'}\n"
-                f"STDERR: {result.stderr[:1000] if result.stderr else '(empty)'}"
+        # Run simulation, with OSOAA's output going straight to log files
+        # in the run directory rather than through Python-side pipes; the
+        # shared files it computes are only published if it succeeds
+        with self._shared_dirs(params) as shared_dirs, \
+                open(os.path.join(run_dir, 'stdout.log'), 'w+b') as stdout_f, \
+                open(os.path.join(run_dir, 'stderr.log'), 'w+b') as stderr_f:
+            cmd = self.build_command({**params, **shared_dirs})
+            result = subprocess.run(
+                cmd,
+                stdout=stdout_f,
+                stderr=stderr_f,
+                cwd=self._cwd,
+                env=self._env,
+                timeout=timeout
             )
 
+            if result.returncode != 0:
+                stdout = self._read_tail(stdout_f)
+                stderr = self._read_tail(stderr_f)
+                raise RuntimeError(
+                    f"OSOAA simulation failed with return code {result.returncode}\n"
+                    f"STDOUT: {stdout if stdout else '(empty)'}\n"
+                    f"STDERR: {stderr if stderr else '(empty)'}"
+                )
+
         # Parse results
-        return self.parse_results(params)
+        results = self.parse_results(params)
+
+        if cache_key is not None:
+            self._run_cache[cache_key] = copy.deepcopy(results)
+
+        return results
+
+    @contextmanager
+    def _shared_dirs(self, params: Dict):
+        """
+        Yield the Mie and surface directories to run params with.
+
+        Each one is a subdirectory of the directory in params, keyed on the
+        parameters that determine its files and on the executable's mtime,
+        and published through _published_dir.
+        """
+        exe_mtime = self.exe_path.stat().st_mtime_ns
+        with ExitStack() as stack:
+            yield {
+                key: stack.enter_context(_published_dir(os.path.join(
+                    params[key], _files_key(params, names, prefixes, exe_mtime))))
+                for key, (names, prefixes) in self._SHARED_DIR_KEYS.items()
+            }
+
+    @staticmethod
+    def _read_tail(log_file, size: int = 1000) -> str:
+        """Return the last size bytes of an open log file, decoded."""
+        fd = log_file.fileno()
+        length = os.fstat(fd).st_size
+        tail = os.pread(fd, min(size, length), max(length - size, 0))
+        return tail.decode('utf-8', errors='replace')
+
+    def run_many(self, params_list: List[Dict], max_workers: Optional[int] = None,
+                 timeout: int = 600) -> List[Dict]:
+        """
+        Run several independent OSOAA simulations concurrently.
+
+        Each simulation gets its own results directory (see run). The Mie
+        and SURF files are shared: a run either reads a complete directory
+        or computes the files in a private one that it publishes when it
+        succeeds (see _published_dir). Threads are enough here: each worker
+        only waits on its own OSOAA_MAIN.exe process.
+
+        Returns the parsed results in the order of params_list.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(
+                lambda params: self.run(params, timeout=timeout), params_list
+            ))
 
     def parse_results(self, params: Dict) -> Dict:
         """Parse OSOAA output files into numpy arrays."""
         results = {'params': params}
 
         # Output files are in Standard_outputs subdirectory
-        output_dir = self.work_dir / 'Standard_outputs'
+        res_root = Path(params.get('OSOAA.ResRoot', self.work_dir))
+        output_dir = res_root / 'Standard_outputs'
 
         # Parse LUM_vsVZA.txt (radiance vs viewing zenith angle)
         vza_filename = params.get('OSOAA.ResFile.vsVZA', 'LUM_vsVZA.txt')
@@ -217,19 +392,16 @@ class OSOAASimulation:
         6: LPOL - Polarized intensity
         7: REFL_POL - Polarized reflectance
         """
-        # Read file and find data start (skip header lines)
         with open(filepath, 'r') as f:
-            lines = f.readlines()
+            # Stream up to the column headers (line starting with "VZA")
+            for line in f:
+                if line.strip().startswith('VZA') and 'SCA_ANG' in line:
+                    break
+            else:
+                f.seek(0)  # No header: the whole file is data
 
-        # Find the line with column headers
-        data_start = 0
-        for i, line in enumerate(lines):
-            if line.strip().startswith('VZA') and 'SCA_ANG' in line:
-                data_start = i + 1
-                break
-
-        # Load data
-        data = np.loadtxt(filepath, skiprows=data_start)
+            # Parse the remaining numeric block in one call to numpy's C parser
+            data = np.fromstring(f.read(), sep=' ').reshape(-1, 7)
 
         return {
             'vza': data[:, 0],              # Viewing Zenith Angle (degrees)
@@ -242,16 +414,34 @@ class OSOAASimulation:
         }
 
     def cleanup(self):
-        """Remove temporary working directory."""
-        if self.work_dir.exists():
-            shutil.rmtree(self.work_dir, ignore_errors=True)
+        """Remove temporary working directory in the background."""
+        _CLEANUP_FUTURES.append(_CLEANUP_POOL.submit(
+            shutil.rmtree, self._work_str, ignore_errors=True
+        ))
+
+
+# ---------------------------------------------------------------------------
+# Helper function: Nadir index
+# ---------------------------------------------------------------------------
+
+def _nadir_index(vza: np.ndarray) -> int:
+    """Index of the viewing zenith angle closest to nadir (VZA = 0)."""
+    return int(np.abs(vza).argmin())
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session", autouse=True)
+def _wait_for_cleanup():
+    """Make sure every background cleanup is finished when the session ends."""
+    yield
+    wait(_CLEANUP_FUTURES)
+    _CLEANUP_FUTURES.clear()
+
+
+@pytest.fixture(scope="session")
 def osoaa_root():
     """Get OSOAA root directory from environment or use default."""
     root = Path(os.environ.get('OSOAA_ROOT', Path(__file__).parent.parent)).resolve()
@@ -261,14 +451,26 @@ def osoaa_root():
     return root
 
 
-@pytest.fixture
-def simulation(osoaa_root):
-    """Create an OSOAASimulation instance with cleanup."""
-    sim = OSOAASimulation(osoaa_root)
+@pytest.fixture(scope="session")
+def simulation(osoaa_root, tmp_path_factory):
+    """
+    Create an OSOAASimulation instance shared by the session.
+
+    Sharing it keeps the run cache and the Mie/surface files across tests;
+    the work directory is removed once, when the session ends.
+    """
+    # tmp_path_factory gives each (xdist) worker its own base directory
+    sim = OSOAASimulation(osoaa_root, work_dir=tmp_path_factory.mktemp('osoaa'))
     yield sim
     sim.cleanup()
 
 
+@pytest.fixture(scope="session")
+def default_results(simulation):
+    """Parsed results of the default 550 nm simulation (read-only, shared)."""
+    return simulation.run(simulation.get_default_params(wavelength_nm=550.0))
+
+
 # ---------------------------------------------------------------------------
 # Test: Basic Simulation (Clear Water at 550 nm)
 # ---------------------------------------------------------------------------
@@ -308,19 +510,15 @@ class TestBasicSimulation:
         assert np.all(I < 1.0), "Normalized radiance should be < 1.0"
 
         # Check nadir value (VZA closest to 0)
-        nadir_idx = np.argmin(np.abs(vza))
-        nadir_radiance = I[nadir_idx]
+        nadir_radiance = I[_nadir_index(vza)]
 
         # Expected nadir radiance for clear water at 550nm is around 0.006
         assert 0.001 < nadir_radiance < 0.05, \
             f"Nadir radiance {nadir_radiance} outside expected range for clear water"
 
-    def test_output_file_columns(self, simulation):
+    def test_output_file_columns(self, default_results):
         """Verify all expected output columns are present."""
-        params = simulation.get_default_params(wavelength_nm=550.0)
-        results = simulation.run(params)
-
-        vza_data = results['vza_data']
+        vza_data = default_results['vza_data']
 
         expected_columns = ['vza', 'scattering_angle', 'I', 'reflectance',
                            'DoLP', 'I_pol', 'refl_pol']
@@ -337,30 +535,37 @@ class TestBasicSimulation:
 class TestChlorophyllSeries:
     """Test effect of chlorophyll concentration on water-leaving radiance."""
 
-    @pytest.mark.parametrize("chlorophyll", [0.03, 0.1, 0.3, 1.0, 3.0])
-    def test_chlorophyll_values(self, simulation, chlorophyll):
+    def test_chlorophyll_values(self, simulation):
         """
         Test simulations across chlorophyll concentration range.
 
         This corresponds to notebook cell 11: chlorophyll series.
         Covers ultra-oligotrophic (0.03) to eutrophic (3.0) waters.
+        The whole series runs as one batch and is checked as one array.
         """
-        params = simulation.get_default_params(
-            wavelength_nm=550.0,
-            solar_zenith=30.0,
-            chlorophyll=chlorophyll,
-            aot=0.1,
-            wind_speed=5.0
-        )
-        params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_chl{chlorophyll}.txt'
+        chl_array = np.array([0.03, 0.1, 0.3, 1.0, 3.0])
 
-        results = simulation.run(params)
+        params_list = []
+        for chlorophyll in chl_array:
+            params = simulation.get_default_params(
+                wavelength_nm=550.0,
+                solar_zenith=30.0,
+                chlorophyll=float(chlorophyll),
+                aot=0.1,
+                wind_speed=5.0
+            )
+            params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_chl{chlorophyll}.txt'
+            params_list.append(params)
 
-        assert 'vza_data' in results
-        I = results['vza_data']['I']
+        all_results = simulation.run_many(params_list)
+        assert all('vza_data' in results for results in all_results)
+
+        # One row of radiance per chlorophyll value
+        I_matrix = np.vstack([results['vza_data']['I'] for results in all_results])
 
         # All radiance values should be positive
-        assert np.all(I > 0), f"Negative radiance found for Chl={chlorophyll}"
+        positive = np.all(I_matrix > 0, axis=1)
+        assert positive.all(), f"Negative radiance found for Chl={chl_array[~positive]}"
 
     def test_chlorophyll_trend(self, simulation):
         """
@@ -372,19 +577,20 @@ class TestChlorophyllSeries:
         chl_values = [0.1, 1.0, 3.0]
         nadir_radiances = []
 
+        params_list = []
         for chl in chl_values:
             params = simulation.get_default_params(
                 wavelength_nm=550.0,
                 chlorophyll=chl
             )
             params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_trend_chl{chl}.txt'
+            params_list.append(params)
 
-            results = simulation.run(params)
+        for results in simulation.run_many(params_list):
             vza = results['vza_data']['vza']
             I = results['vza_data']['I']
 
-            nadir_idx = np.argmin(np.abs(vza))
-            nadir_radiances.append(I[nadir_idx])
+            nadir_radiances.append(I[_nadir_index(vza)])
 
         # Higher chlorophyll should produce different radiance values
         # (the relationship is complex, but values should not be identical)
@@ -399,29 +605,38 @@ class TestChlorophyllSeries:
 class TestSpectralSimulations:
     """Test simulations across visible wavelength spectrum."""
 
-    @pytest.mark.parametrize("wavelength_nm", [443, 490, 510, 555, 670])
-    def test_wavelength_bands(self, simulation, wavelength_nm):
+    def test_wavelength_bands(self, simulation):
         """
         Test simulations at common ocean color wavelength bands.
 
         This corresponds to notebook cell 14: spectral simulations.
+        All bands run as one batch and are checked as one array.
         """
-        params = simulation.get_default_params(
-            wavelength_nm=float(wavelength_nm),
-            solar_zenith=30.0,
-            chlorophyll=0.3,  # Moderate chlorophyll
-            aot=0.1,
-            wind_speed=5.0
-        )
-        params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_wl{wavelength_nm}.txt'
+        wl_array = np.array([443, 490, 510, 555, 670])
 
-        results = simulation.run(params)
+        params_list = []
+        for wavelength_nm in wl_array:
+            params = simulation.get_default_params(
+                wavelength_nm=float(wavelength_nm),
+                solar_zenith=30.0,
+                chlorophyll=0.3,  # Moderate chlorophyll
+                aot=0.1,
+                wind_speed=5.0
+            )
+            params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_wl{wavelength_nm}.txt'
+            params_list.append(params)
+
+        all_results = simulation.run_many(params_list)
+        missing = [wl for wl, results in zip(wl_array, all_results) if 'vza_data' not in results]
+        assert not missing, f"No output for wavelengths {missing}nm"
 
-        assert 'vza_data' in results, f"No output for wavelength {wavelength_nm}nm"
+        # One row of radiance per wavelength
+        I_matrix = np.vstack([results['vza_data']['I'] for results in all_results])
 
-        I = results['vza_data']['I']
-        assert np.all(I > 0), f"Negative radiance at {wavelength_nm}nm"
-        assert np.all(I < 1.0), f"Unrealistic radiance at {wavelength_nm}nm"
+        positive = np.all(I_matrix > 0, axis=1)
+        realistic = np.all(I_matrix < 1.0, axis=1)
+        assert positive.all(), f"Negative radiance at {wl_array[~positive]}nm"
+        assert realistic.all(), f"Unrealistic radiance at {wl_array[~realistic]}nm"
 
     def test_spectral_shape(self, simulation):
         """
@@ -433,19 +648,20 @@ class TestSpectralSimulations:
         wavelengths = [443, 555, 670]
         nadir_radiances = {}
 
+        params_list = []
         for wl in wavelengths:
             params = simulation.get_default_params(
                 wavelength_nm=float(wl),
                 chlorophyll=0.3
             )
             params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_spectral_{wl}.txt'
+            params_list.append(params)
 
-            results = simulation.run(params)
+        for wl, results in zip(wavelengths, simulation.run_many(params_list)):
             vza = results['vza_data']['vza']
             I = results['vza_data']['I']
 
-            nadir_idx = np.argmin(np.abs(vza))
-            nadir_radiances[wl] = I[nadir_idx]
+            nadir_radiances[wl] = I[_nadir_index(vza)]
 
         # Verify spectral variation exists
         values = list(nadir_radiances.values())
@@ -460,16 +676,13 @@ class TestSpectralSimulations:
 class TestPolarization:
     """Test polarization output from OSOAA simulations."""
 
-    def test_polarization_output(self, simulation):
+    def test_polarization_output(self, default_results):
         """
         Verify polarization quantities are computed.
 
         This corresponds to notebook cell 17: polarization analysis.
         """
-        params = simulation.get_default_params(wavelength_nm=550.0)
-        results = simulation.run(params)
-
-        vza_data = results['vza_data']
+        vza_data = default_results['vza_data']
 
         # Check polarization columns exist
         assert 'DoLP' in vza_data, "Degree of Linear Polarization missing"
@@ -485,16 +698,13 @@ class TestPolarization:
         # Polarized intensity should be non-negative
         assert np.all(I_pol >= 0), "Polarized intensity should be non-negative"
 
-    def test_polarization_relation(self, simulation):
+    def test_polarization_relation(self, default_results):
         """
         Verify relationship between total and polarized radiance.
 
         Polarized intensity should always be <= total intensity.
         """
-        params = simulation.get_default_params(wavelength_nm=550.0)
-        results = simulation.run(params)
-
-        vza_data = results['vza_data']
+        vza_data = default_results['vza_data']
         I = vza_data['I']
         I_pol = vza_data['I_pol']
 
@@ -532,26 +742,34 @@ class TestParameterValidation:
 
     def test_different_solar_angles(self, simulation):
         """Test simulations with different solar zenith angles."""
-        for sza in [0.0, 30.0, 60.0]:
+        sza_values = [0.0, 30.0, 60.0]
+
+        params_list = []
+        for sza in sza_values:
             params = simulation.get_default_params(
                 wavelength_nm=550.0,
                 solar_zenith=sza
             )
             params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_sza{sza}.txt'
+            params_list.append(params)
 
-            results = simulation.run(params)
+        for sza, results in zip(sza_values, simulation.run_many(params_list)):
             assert 'vza_data' in results, f"Failed for SZA={sza}"
 
     def test_different_wind_speeds(self, simulation):
         """Test simulations with different wind speeds."""
-        for wind in [1.0, 5.0, 10.0]:
+        wind_values = [1.0, 5.0, 10.0]
+
+        params_list = []
+        for wind in wind_values:
             params = simulation.get_default_params(
                 wavelength_nm=550.0,
                 wind_speed=wind
             )
             params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_wind{wind}.txt'
+            params_list.append(params)
 
-            results = simulation.run(params)
+        for wind, results in zip(wind_values, simulation.run_many(params_list)):
             assert 'vza_data' in results, f"Failed for wind={wind}m/s"
 
 
@@ -620,21 +838,21 @@ class TestIntegration:
             assert len(arr) == n_points, \
                 f"Inconsistent array length for {key}: {len(arr)} vs {n_points}"
 
-    def test_multiple_sequential_runs(self, simulation):
-        """Test running multiple simulations sequentially."""
+    def test_multiple_concurrent_runs(self, simulation):
+        """Test running multiple simulations concurrently."""
         configs = [
             {'wavelength_nm': 443, 'chlorophyll': 0.1},
             {'wavelength_nm': 555, 'chlorophyll': 0.5},
             {'wavelength_nm': 670, 'chlorophyll': 1.0},
         ]
 
-        all_results = []
+        params_list = []
         for i, config in enumerate(configs):
             params = simulation.get_default_params(**config)
             params['OSOAA.ResFile.vsVZA'] = f'LUM_vsVZA_seq_{i}.txt'
+            params_list.append(params)
 
-            results = simulation.run(params)
-            all_results.append(results)
+        all_results = simulation.run_many(params_list)
 
         assert len(all_results) == 3
         for results in all_results: